@@ -9,23 +9,39 @@ import math
 import socket
 import time
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def rms(data, width=8):
-    sum_squares = 0
     if width == 8:
-        sum_squares = sum([v*v for v in data])
+        if numpy is not None:
+            # one vectorized pass instead of a temporary list of python ints
+            arr = numpy.frombuffer(data, dtype=numpy.uint8).astype(numpy.int32)
+            return int(math.sqrt(int((arr * arr).sum()) / len(data)))
+        sum_squares = 0
+        for v in data:
+            sum_squares += v * v
         return int(math.sqrt(sum_squares / len(data)))
 
 
-def sample(audio, connection):
+def sample(audio, sock, addr, n_windows=16):
+    """ Read n_windows chunks per loop and send one rms byte per window in a single datagram """
     bytes_out = 0
-    buf = bytearray(1)
+    buf = bytearray(n_windows)
 
     while True:
-        vol = rms(audio.read(chunk))
-        buf[0] = vol
-        bytes_out += connection.send(buf)
-        time.sleep(1)
+        data = audio.read(chunk * n_windows)
+        if numpy is not None:
+            arr = numpy.frombuffer(data, dtype=numpy.uint8).astype(numpy.int32)
+            arr = arr.reshape(n_windows, chunk)
+            buf[:] = numpy.sqrt((arr * arr).mean(axis=1)).astype(numpy.uint8).tobytes()
+        else:
+            for i in range(n_windows):
+                buf[i] = rms(data[i * chunk:(i + 1) * chunk])
+        bytes_out += sock.sendto(buf, addr)
 
 
 if __name__ == '__main__':
@@ -38,12 +54,11 @@ if __name__ == '__main__':
                      input=True,
                      frames_per_buffer = chunk)
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.setsockopt(socket.SOL_SOCKET,socket.SO_REUSEADDR,1)
     sock.bind(('', 2263))
-    sock.listen(5)
     while True:
-        cnx, addr = sock.accept()
-        cnx.settimeout(0)
-        print('Connected to {}'.format(addr))
-        sample(stream, cnx)
\ No newline at end of file
+        # wait for any datagram so we know where to stream the levels
+        msg, addr = sock.recvfrom(16)
+        print('Streaming to {}'.format(addr))
+        sample(stream, sock, addr)
\ No newline at end of file
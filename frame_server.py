@@ -0,0 +1,59 @@
+#!/usr/bin/python
+"""
+Compose animation frames on the host and stream them to the strip over UDP.
+The MCU receiver only has to copy each datagram into its pixel buffer and
+call write(); all of the per-pixel math happens here where it is cheap.
+"""
+import socket
+import time
+
+N_PIXELS = 100
+BPP = 3
+FRAME_PORT = 5581
+FPS = 50
+
+
+def color_wheel(hue, val=255):
+    """ Same 255 degree wheel as trickLED.color_wheel, duplicated so this script has no MCU imports """
+    hue %= 255
+    pa = hue % 85
+    ci = int(val / 85 * pa)
+    cd = val - ci
+    if hue < 85:
+        return cd, ci, 0
+    elif hue < 170:
+        return 0, cd, ci
+    else:
+        return ci, 0, cd
+
+
+def wheel_frames(n, bpp=BPP, brightness=200):
+    """ Precompute one full scroll period, then every frame is just a rotation of the buffer. """
+    buf = bytearray(n * bpp)
+    for i in range(n):
+        buf[i * bpp:(i + 1) * bpp] = bytes(color_wheel(i * 255 // n, brightness))
+    while True:
+        yield buf
+        buf = buf[bpp:] + buf[:bpp]
+
+
+def stream(sock, addr, n_pixels=N_PIXELS, fps=FPS):
+    period = 1 / fps
+    deadline = time.monotonic()
+    for frame in wheel_frames(n_pixels):
+        sock.sendto(frame, addr)
+        deadline += period
+        slack = deadline - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
+
+
+if __name__ == '__main__':
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(('', FRAME_PORT))
+    while True:
+        # wait for any datagram so we know where to stream the frames
+        msg, addr = sock.recvfrom(16)
+        print('Streaming {} pixel frames to {}'.format(N_PIXELS, addr))
+        stream(sock, addr)
@@ -98,6 +98,24 @@ class TrickLEDTest(unittest.TestCase):
         bm.scroll(-101)
         self.assertEqual(0, bm[0], 'incorrect value for scroll(-1)')
 
+    def test_bit_map_bulk(self):
+        bm = trickLED.BitMap(100)
+        bm.repeat(trickLED.BITS_NONE)
+        bm.set_range(5, 40)
+        self.assertEqual([1 if 5 <= i <= 40 else 0 for i in range(100)],
+                         [bm[i] for i in range(100)], 'set_range set wrong bits')
+        self.assertEqual(36, bm.popcount(), 'popcount does not match set bits')
+        bm.set_range(10, 20, 0)
+        self.assertEqual(25, bm.popcount(), 'set_range(val=0) did not clear bits')
+        # ranges must respect the scroll offset like single-bit access does
+        bm.repeat(trickLED.BITS_NONE)
+        bm.scroll(7)
+        bm.set_range(95, 99)
+        self.assertEqual([bm[i] for i in range(100)],
+                         [1 if 95 <= i else 0 for i in range(100)], 'set_range ignored scroll offset')
+        bm.repeat(trickLED.BITS_ALL)
+        self.assertEqual(100, bm.popcount(), 'popcount counted bits past n')
+
     def test_byte_map(self):
         bm = trickLED.ByteMap(30, bpi=3)
         bm[20] = self.c1
@@ -118,3 +136,20 @@ class TrickLEDTest(unittest.TestCase):
         bm.div((4, 1, 5))
         self.assertEqual((25, 255, 40), bm[0], 'incorrect value after ByteMap.div')
 
+    def test_matrix_vscroll(self):
+        # odd height so wrapped rows move an even distance while the rest move odd
+        tm = trickLED.TrickMatrix(Pin(26), 4, 3, shape=trickLED.TrickMatrix.LAYOUT_SNAKE)
+        for y in range(3):
+            for x in range(4):
+                tm.pixel(x, y, (x, y, 0))
+        tm.vscroll(1)
+        for y in range(3):
+            for x in range(4):
+                self.assertEqual((x, (y - 1) % 3, 0), tuple(tm.pixel(x, y)),
+                                 'incorrect pixel after snake vscroll(1)')
+        tm.vscroll(-4)
+        for y in range(3):
+            for x in range(4):
+                self.assertEqual((x, y, 0), tuple(tm.pixel(x, y)),
+                                 'vscroll(-4) on height 3 should undo vscroll(1)')
+
@@ -19,8 +19,10 @@ def default_palette(n, brightness=200):
     rn = getrandbits(8)
     pal = trickLED.ByteMap(n, 3)
     sa = min(255 // n, 30)
+    lut = trickLED.color_wheel_lut(brightness)
     for i in range(n):
-        pal[i] = trickLED.color_wheel((rn + sa * i) % 255, brightness)
+        hue = (rn + sa * i) % 255
+        pal.buf[i * 3:(i + 1) * 3] = lut[hue * 3:(hue + 1) * 3]
     return pal
 
 
@@ -47,6 +49,8 @@ class AnimationBase:
                          'scroll_speed': int(1), 'brightness': trickLED.uint8(brightness)}
         # stores run time information needed for the animation
         self.state = {}
+        # zero pattern for _blank(), allocated on first use
+        self._zeros = None
         # number of pixels to calculate before copying from buffer
         if self.leds.repeat_n:
             self.calc_n = self.leds.repeat_n
@@ -84,6 +88,13 @@ class AnimationBase:
             raise ValueError('Invalid type for palette {}'.format(val.__class__.__name__))
         self.__palette = pal
 
+    def _blank(self):
+        """ Zero the whole pixel buffer with one slice store instead of a per-pixel fill """
+        buf = self.leds.buf
+        if self._zeros is None or len(self._zeros) != len(buf):
+            self._zeros = bytes(len(buf))
+        buf[:] = self._zeros
+
     def setup(self):
         """ Called once at the start of animation.  """
         pass
@@ -100,29 +111,45 @@ class AnimationBase:
         """
         for kw in kwargs:
             self.settings[kw] = kwargs[kw]
-        self.leds.fill((0,0,0))
+        self._blank()
         self.setup()
         self.frame = 0        
         ival = self.settings['interval']
         self.state['start_ticks'] = time.ticks_ms()
+        # microsecond timestamp gives _print_fps better resolution on short runs
+        self.state['start_ticks_us'] = time.ticks_us()
+        deadline = self.state['start_ticks']
+        last_buf = None
         try:
-            while max_iterations == 0 or self.frame < max_iterations:
+            while True:
                 self.frame += 1
                 self.calc_frame()
-                self.leds.write()
-                await asyncio.sleep_ms(ival)
+                if last_buf is None:
+                    # always push the first frame, then only frames that changed the buffer
+                    self.leds.write()
+                    last_buf = bytearray(self.leds.buf)
+                elif self.leds.buf != last_buf:
+                    self.leds.write()
+                    last_buf[:] = self.leds.buf
+                # checked after rendering, so max_iterations == 0 runs until interrupted
+                if self.frame == max_iterations:
+                    break
+                # sleep until an absolute deadline so time spent rendering does not stretch the frame period
+                deadline = time.ticks_add(deadline, ival)
+                slack = time.ticks_diff(deadline, time.ticks_ms())
+                await asyncio.sleep_ms(slack if slack > 0 else 0)
             self._print_fps()
         except KeyboardInterrupt:
             self._print_fps()
             return
 
     def _print_fps(self):
-        st = self.state.get('start_ticks')
+        st = self.state.get('start_ticks_us')
         if st is None:
             return
-        et = time.ticks_ms()
+        et = time.ticks_us()
         ival = self.settings.get('interval')
-        fps = self.frame / time.ticks_diff(et, st) * 1000
+        fps = self.frame / time.ticks_diff(et, st) * 1000000
         ifps = 1000 / ival if ival > 0 else 1000
         print('Actual fps: {:0.02f} - interval fps: {:0.02f}\n'.format(fps, ifps))
 
@@ -147,7 +174,7 @@ class NextGen(AnimationBase):
         self.settings['scroll_speed'] = int(scroll_speed)
 
     def setup(self):
-        self.leds.fill(0)
+        self._blank()
         stripe_size = self.settings.get('stripe_size', 1)
         blanks = self.settings['blanks']
         # limit scrolling to either 1 or -1
@@ -198,6 +225,7 @@ class LitBits(AnimationBase):
         self.lit = trickLED.BitMap(self.calc_n)
         if not self.settings['lit_percent']:
             self.lit.repeat(119)  # three on one off
+        self._pal_ordered = None
 
     def setup(self):
         if self.palette is None:
@@ -205,18 +233,43 @@ class LitBits(AnimationBase):
         if self.settings.get('lit_percent'):
             self.lit.pct = self.settings.get('lit_percent')
             self.lit.randomize()
+        # pre-render the palette in strip byte order once so frames can copy slices
+        pal = self.palette
+        buf = bytearray(pal.n * pal.bpi)
+        for i in range(pal.n):
+            o = i * pal.bpi
+            buf[o:o + pal.bpi] = pal.get_ordered_item(i)
+        self._pal_ordered = buf
 
     def calc_frame(self):
         if self.settings['lit_percent'] and self.frame % 30 == 0:
             self.lit.randomize()
-        pl = len(self.palette)
+        bpp = self.leds.bpp
+        nbytes = self.calc_n * bpp
+        pal = self._pal_ordered
+        buf = self.leds.buf
+        # tile the pre-rendered palette across the strip in one copy, then blank the unlit pixels
+        reps = (nbytes + len(pal) - 1) // len(pal)
+        buf[0:nbytes] = (bytes(pal) * reps)[0:nbytes]
+        # walk the lit bits sequentially with a rolling index instead of paying
+        # the scroll-offset modulo inside BitMap.__getitem__ for every pixel
+        lit = self.lit
+        lbuf = lit.buf
+        ln = lit.n
+        j = lit._po
+        zero = bytes(bpp)
+        o = 0
         for i in range(self.calc_n):
-            if self.lit[i] == 1:
-                col = self.palette[i % pl]
-            else:
-                col = 0
-            self.leds[i] = col
-        self.palette.scroll(self.settings.get('scroll_speed', 1))
+            if j >= ln:
+                j -= ln
+            if not (lbuf[j >> 3] >> (j & 7)) & 1:
+                buf[o:o + bpp] = zero
+            j += 1
+            o += bpp
+        ss = self.settings.get('scroll_speed', 1)
+        self.palette.scroll(ss)
+        cut = bpp * -ss
+        self._pal_ordered = pal[cut:] + pal[:cut]
         self.lit.scroll(self.settings.get('lit_scroll_speed', -1))
 
 
@@ -240,42 +293,65 @@ class Jitter(LitBits):
         self.settings['background'] = background
         self.settings['lit_percent'] = lit_percent
         self.settings['fill_mode'] = fill_mode or trickLED.FILL_MODE_MULTI
+        self._fade_luts = None
+        self._fade_key = None
 
     def setup(self):
         self.lit.pct = self.settings['lit_percent']
         self.settings['background'] = trickLED.colval(self.settings['background'])
         if not self.generator:
             self.generator = generators.random_pastel(bpp=self.leds.bpp)
+        self._calc_fade_luts()
+
+    def _calc_fade_luts(self):
+        """ Precompute one fade table per channel, in strip byte order. Fading a pixel toward the
+            background is then a lookup per byte instead of a blend() call per pixel.
+        """
+        bg = self.leds._rgb_to_order(self.settings['background'])
+        pct = self.settings['fade_percent']
+        key = (bytes(bg), pct)
+        if key == self._fade_key:
+            return
+        self._fade_luts = []
+        for c in bg:
+            self._fade_luts.append(bytes(trickLED.uint8(v + (c - v) / 100 * pct) for v in range(256)))
+        self._fade_key = key
+
+    def _fade_buffer(self, buf):
+        """ Fade the whole strip toward the background in one flat pass over the raw buffer """
+        bpp = self.leds.bpp
+        nb = self.calc_n * bpp
+        for j in range(bpp):
+            lut = self._fade_luts[j]
+            for k in range(j, nb, bpp):
+                buf[k] = lut[buf[k]]
 
     def calc_frame(self):
         bg = self.settings.get('background')
-        fade_percent = self.settings.get('fade_percent')
         rv = getrandbits(8)
         fill_mode = self.settings.get('fill_mode')
+        leds = self.leds
+        lit = self.lit
+        gen = self.generator
+        # fade everything branch-free first; the pixels we are about to
+        # overwrite below don't care what they faded to
+        self._fade_buffer(leds.buf)
         if rv < self.settings.get('sparking'):
             # sparking
-            self.lit.randomize()
-            spark_col = next(self.generator)
+            lit.randomize()
+            spark_col = next(gen)
             for i in range(self.calc_n):
-                if self.lit[i]:
+                if lit[i]:
                     if fill_mode == trickLED.FILL_MODE_SOLID:
                         col = spark_col
                     else:
-                        col = next(self.generator)
-                    self.leds[i] = col
-                else:
-                    col = self.leds[i]
-                    if col != bg:
-                        col = trickLED.blend(col, bg, fade_percent)
-                        self.leds[i] = col
+                        col = next(gen)
+                    leds[i] = col
         else:
             # not sparking
             for i in range(self.calc_n):
-                if self.lit[i]:
-                    col = trickLED.blend(self.leds[i], bg, fade_percent)
-                else:
-                    col = bg
-                self.leds[i] = col
+                if not lit[i]:
+                    leds[i] = bg
 
 
 class SideSwipe(AnimationBase):
@@ -325,7 +401,7 @@ class Convergent(AnimationBase):
 
     def start_cycle(self):
         self.state['movers'] = self.state['insert_points'][:]
-        self.leds.fill(0)
+        self._blank()
         self.state['palette_idx'] = (self.state['palette_idx'] + 1) % len(self.palette)
         self.state['color'] = self.palette[self.state['palette_idx']]
         for ip in self.state['insert_points']:
@@ -336,13 +412,20 @@ class Convergent(AnimationBase):
         mvr = []
         new_insert = False
         new_cycle = False
+        buf = self.leds.buf
+        bpp = self.leds.bpp
+        zero = bytes(bpp)
         for mv in self.state['movers']:
             ni = mv + idir
             idir *= -1
             if 0 <= ni < self.calc_n:
-                if not any(self.leds[ni]):
-                    self.leds[ni] = self.leds[mv]
-                    self.leds[mv] = 0
+                # check occupancy on the raw buffer, skipping the pixel unpack
+                if buf[ni * bpp:(ni + 1) * bpp] == zero:
+                    # move the pixel with raw slice copies instead of
+                    # unpacking and re-packing it through __getitem__
+                    mo = mv * bpp
+                    buf[ni * bpp:(ni + 1) * bpp] = buf[mo:mo + bpp]
+                    buf[mo:mo + bpp] = zero
                     mvr.append(ni)
                 elif mv in self.state['insert_points']:
                     new_cycle = True
@@ -381,7 +464,7 @@ class Divergent(AnimationBase):
 
     def start_cycle(self):
         self.state['movers'] = self.state['insert_points'][:]
-        self.leds.fill(0)
+        self._blank()
         self.state['palette_idx'] = (self.state['palette_idx'] + 1) % len(self.palette)
         self.state['color'] = self.palette[self.state['palette_idx']]
         for ip in self.state['insert_points']:
@@ -392,13 +475,20 @@ class Divergent(AnimationBase):
         mvr = []
         new_insert = False
         new_cycle = False
+        buf = self.leds.buf
+        bpp = self.leds.bpp
+        zero = bytes(bpp)
         for mv in self.state['movers']:
             ni = mv + idir
             idir *= -1
             if 0 <= ni < self.calc_n:
-                if not any(self.leds[ni]):
-                    self.leds[ni] = self.leds[mv]
-                    self.leds[mv] = 0
+                # check occupancy on the raw buffer, skipping the pixel unpack
+                if buf[ni * bpp:(ni + 1) * bpp] == zero:
+                    # move the pixel with raw slice copies instead of
+                    # unpacking and re-packing it through __getitem__
+                    mo = mv * bpp
+                    buf[ni * bpp:(ni + 1) * bpp] = buf[mo:mo + bpp]
+                    buf[mo:mo + bpp] = zero
                     mvr.append(ni)
                 elif mv in self.state['insert_points']:
                     new_cycle = True
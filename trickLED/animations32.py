@@ -21,33 +21,53 @@ class MappedAnimationBase(AnimationBase):
         self.settings['palette_shift'] = 0
         self.pixel_meta = trickLED.ByteMap(self.calc_n, 1)
         self._ordered_palette = None
+        self._heat_lut = None
 
     def set_ordered_palette(self):
-        """ Convert RGB palette to byte order of our strip.  """
+        """ Convert RGB palette to byte order of our strip and rebuild the heat table. """
         pal = self.palette
         if self._ordered_palette is None or pal.n != self._ordered_palette.n:
             self._ordered_palette = trickLED.ByteMap(pal.n, pal.bpi)
         op = self._ordered_palette
         for i in range(pal.n):
             op[i] = pal.get_ordered_item(i)
-
-    def colorize(self):
+        # map every possible meta byte straight to its ordered color bytes,
+        # folding in palette_shift; zero stays black as before
+        shift = self.settings.get('palette_shift', 0)
+        bpi = op.bpi
+        mx = op.n - 1
+        lut = bytearray(256 * bpi)
+        for m in range(1, 256):
+            i = m >> shift
+            if i > mx:
+                i = mx
+            lut[m * bpi:(m + 1) * bpi] = op.buf[i * bpi:(i + 1) * bpi]
+        self._heat_lut = lut
+
+    def colorize(self, sub=0):
         """ Convert pixel meta data to colors.  To improve speed:
         1) We write directly to the leds buffer
-        2) Pre-convert the palette from RGB to strip byte order (probably GRB)
+        2) Heat values index a pre-built table of colors in strip byte order
+        Passing sub also subtracts that much from each meta value on the way
+        through, so cooling and colorizing share one pass over the pixels.
         """
         buf = bytearray()
-        pal = self._ordered_palette
-        meta = self.pixel_meta
-        shift = self.settings.get('palette_shift', 0)
-        zero = bytearray([0,0,0])
-        bpi = pal.bpi
-        for m in meta:
-            if m:
-                i = (m >> shift) * bpi
-                buf += pal.buf[i:i+bpi]
-            else:
-                buf += zero
+        # memoryview slices reference the table instead of copying 3 bytes per pixel
+        lut = memoryview(self._heat_lut)
+        bpi = self._ordered_palette.bpi
+        meta = self.pixel_meta.buf
+        if sub:
+            for i in range(len(meta)):
+                m = meta[i] - sub
+                if m < 0:
+                    m = 0
+                meta[i] = m
+                o = m * bpi
+                buf += lut[o:o + bpi]
+        else:
+            for m in meta:
+                o = m * bpi
+                buf += lut[o:o + bpi]
         if len(self.leds.buf) == len(buf):
             self.leds.buf = buf
         else:
@@ -68,8 +88,10 @@ class Fire(MappedAnimationBase):
         :param kwargs:
         """
         super().__init__(leds, **kwargs)
-        # Blend map keeps track of which positions need blended
-        self._blend_map = trickLED.BitMap(self.calc_n)
+        # positions that need blending, calculated in setup()
+        self._blend_idx = []
+        # scratch copy of the heat map, reused every frame so calc_frame does not allocate
+        self._heat_prev = bytearray(self.calc_n)
         self.settings['sparking'] = sparking
         self.settings['cooling'] = cooling
         self.settings['scroll_speed'] = int(scroll_speed)
@@ -88,6 +110,14 @@ class Fire(MappedAnimationBase):
                 self.palette[i] = trickLED.heat_color(i * 4)
 
     def setup(self):
+        # determine if we are mapping 256 levels of heat to 64, 128 or 256 colors
+        # before building the heat table
+        if len(self.palette) >= 256:
+            self.settings['palette_shift'] = 0
+        elif len(self.palette) >= 128:
+            self.settings['palette_shift'] = 1
+        else:
+            self.settings['palette_shift'] = 2
         self.set_ordered_palette()
         self.pixel_meta.fill(0)
         # add insertion points and calculate ranges to blend
@@ -116,32 +146,36 @@ class Fire(MappedAnimationBase):
                 ip = min(max(ip, 0), self.calc_n - 1)
             self._flash_points.add(ip)
 
-        # calculate blend_map
-        self._blend_map.repeat(0)
+        # calculate which positions need blending; the set is static per setup
+        # so calc_frame just walks the sorted index list
+        blend = set()
         for fp in self._flash_points:
             for i in range(fp + bmin, fp + bmax):
                 if 0 <= i < self.calc_n and i not in self._flash_points:
-                    self._blend_map[i] = 1
-
-        # determine if we are mapping 256 levels of heat to 64, 128 or 256 colors
-        if len(self.palette) >= 256:
-            self.settings['palette_shift'] = 0
-        elif len(self.palette) >= 128:
-            self.settings['palette_shift'] = 1
-        else:
-            self.settings['palette_shift'] = 2
+                    blend.add(i)
+        self._blend_idx = sorted(blend)
 
     def calc_frame(self):
-        uint8 = trickLED.uint8
         cn = self.calc_n
         mi = cn - 1
-        if self.settings['scroll_speed'] != 0:
-            self.pixel_meta.scroll(self.settings['scroll_speed'])
-
-        # calculate sparks at insertion points
+        # settings don't change mid-frame, read them once
+        scroll_speed = self.settings['scroll_speed']
+        sparking = self.settings['sparking']
+        if scroll_speed != 0:
+            self.pixel_meta.scroll(scroll_speed)
+
+        # calculate sparks at insertion points, peeling bytes off one 32-bit
+        # draw so four flash points share a single PRNG call
+        rnd = 0
+        avail = 0
         for ip in self._flash_points:
-            spark = getrandbits(8)
-            if spark <= self.settings['sparking']:
+            if avail == 0:
+                rnd = getrandbits(32)
+                avail = 4
+            spark = rnd & 255
+            rnd >>= 8
+            avail -= 1
+            if spark <= sparking:
                 # add a spark at insert_point with random heat between 192 and 255
                 val = 192 + (spark & 63)
             else:
@@ -149,20 +183,18 @@ class Fire(MappedAnimationBase):
             self.pixel_meta[ip] = val
 
         # blend - copy heat map so we don't "cool" as we are blending
-        heat_map = trickLED.ByteMap(self.calc_n, bpi=1)
-        heat_map.buf = self.pixel_meta.buf[:]
-        for i in range(self.calc_n):
-            if self._blend_map[i]:
-                if 0 < i < mi:
-                    val = sum(heat_map[i-1:i+2]) / 3
-                elif i == 0:
-                    val = sum(heat_map[0:2]) / 2
-                else:
-                    val = sum(heat_map[-2:]) / 2
-                self.pixel_meta[i] = uint8(val)
-        # cool
-        self.pixel_meta.sub(self.settings.get('cooling'))
-        self.colorize()
+        heat_map = self._heat_prev
+        heat_map[:] = self.pixel_meta.buf
+        meta = self.pixel_meta.buf
+        for i in self._blend_idx:
+            if 0 < i < mi:
+                meta[i] = (heat_map[i-1] + heat_map[i] + heat_map[i+1]) // 3
+            elif i == 0:
+                meta[0] = (heat_map[0] + heat_map[1]) >> 1
+            else:
+                meta[mi] = (heat_map[mi-1] + heat_map[mi]) >> 1
+        # cool and colorize in a single pass
+        self.colorize(sub=self.settings.get('cooling'))
 
 
 class Conjunction(MappedAnimationBase):
@@ -183,7 +215,7 @@ class Conjunction(MappedAnimationBase):
 
     def start_cycle(self):
         self.pixel_meta.fill(0)
-        self.leds.fill(0)
+        self._blank()
         self.palette.fill_gen(self.generator, start_pos=1, direction=-1)
         self.palette[0] = trickLED.colval(0)
         self.set_ordered_palette()
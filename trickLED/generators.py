@@ -27,9 +27,13 @@ def stepped_color_wheel(hue_stride=10, stripe_size=20, start_hue=0):
         c1 = trickLED.color_wheel(hue, brightness)
         c2 = trickLED.color_wheel((hue - ho) % 255, db)
         inc = trickLED.step_inc(c1, c2, stripe_size - 1)
+        # accumulate the increment instead of rebuilding scaled lists per yield
+        r, g, b = c1
         for i in range(stripe_size):
-            incs = [v * i for v in inc]
-            yield tuple(map(trickLED.add8, c1, incs))
+            yield trickLED.uint8(r), trickLED.uint8(g), trickLED.uint8(b)
+            r += inc[0]
+            g += inc[1]
+            b += inc[2]
         hue = (hue + hue_stride) % 255
 
 
@@ -42,11 +46,13 @@ def striped_color_wheel(hue_stride=10, stripe_size=10, start_hue=0):
     :param start_hue: Starting hue on color wheel
     :return: color generator
     """
-    hue = start_hue
+    # the table only holds hues 0-254, so wrap like color_wheel does
+    hue = start_hue % 255
     if hue_stride == 0:
         hue_stride = 1
     while True:
-        col = trickLED.color_wheel(hue, trickLED.global_setings.get('brightness'))
+        lut = trickLED.color_wheel_lut(trickLED.global_setings.get('brightness'))
+        col = tuple(lut[hue * 3:hue * 3 + 3])
         for i in range(stripe_size):
             yield col
         hue = (hue + hue_stride) % 255
@@ -95,12 +101,15 @@ def color_compliment(hue_stride=10, stripe_size=1, start_hue=0):
     :param start_hue: Location on color wheel to begin
     :return color generator
     """
-    hue = start_hue
+    # the table only holds hues 0-254, so wrap like color_wheel does
+    hue = start_hue % 255
     while True:
-        col = trickLED.color_wheel(hue, trickLED.global_setings.get('brightness'))
+        lut = trickLED.color_wheel_lut(trickLED.global_setings.get('brightness'))
+        col = tuple(lut[hue * 3:hue * 3 + 3])
         for i in range(stripe_size):
             yield col
-        col = trickLED.color_wheel((hue + 127) % 255, trickLED.global_setings.get('brightness'))
+        ch = (hue + 127) % 255
+        col = tuple(lut[ch * 3:ch * 3 + 3])
         for i in range(stripe_size):
             yield col
         hue = (hue + hue_stride) % 255
@@ -121,7 +130,8 @@ def random_vivid():
         second = brightness - prime
         s = shifts[cov]
         val = prime << s[0] | second << s[1]
-        yield tuple(val.to_bytes(3, 'big'))
+        p = val.to_bytes(3, 'big')
+        yield (p[0], p[1], p[2])
 
 
 def random_pastel(bpp=3, mask=None):
@@ -141,6 +151,7 @@ def random_pastel(bpp=3, mask=None):
             mi = (mi << 8) | mask[i]
     else:
         mi = 2 ** bc - 1
+    gb = getrandbits
     while True:
-        val = getrandbits(bc) & mi
+        val = gb(bc) & mi
         yield tuple(val.to_bytes(bpp, 'big'))
@@ -1,8 +1,8 @@
 import math
-import struct
 
 from random import getrandbits
 from neopixel import NeoPixel
+import micropython
 from micropython import const
 
 BITS_LOW = const(15)             # 00001111
@@ -32,6 +32,7 @@ global_state = {
 }
 
 
+@micropython.native
 def blend(col1, col2, pct=50):
     """
     Blend color 1 with percentage of color 2
@@ -41,27 +42,33 @@ def blend(col1, col2, pct=50):
     :param pct: Percentage of color 2
     :return: color tuple
     """
-    if 0 <= pct <= 100:      
-        result = [0, 0, 0]
-        for i in range(len(col1)):
-            result[i] = uint8(col1[i] + (col2[i] - col1[i]) / 100 * pct)
-        return tuple(result)
-    else:
+    if not 0 <= pct <= 100:
         return col1
+    # all-integer lerp; for byte inputs the result stays in range so no clamp
+    if len(col1) == 3:
+        v0, v1, v2 = col1
+        return (v0 + (col2[0] - v0) * pct // 100,
+                v1 + (col2[1] - v1) * pct // 100,
+                v2 + (col2[2] - v2) * pct // 100)
+    return tuple(v + (col2[i] - v) * pct // 100 for i, v in enumerate(col1))
     
 
 def step_inc(c1, c2, steps):
     """ Calculate step increment to blend colors in n steps """
-    return tuple((c2[i] - c1[i]) / steps for i in range(len(c1)))  
+    if len(c1) == 3:
+        # skip the generator machinery for the common RGB case
+        return (c2[0] - c1[0]) / steps, (c2[1] - c1[1]) / steps, (c2[2] - c1[2]) / steps
+    return tuple((c2[i] - c1[i]) / steps for i in range(len(c1)))
 
 
+@micropython.native
 def uint8(val):
-    if 0 <= val <= 255:
-        return int(val)
-    if val < 0:
-        return 0
-    else:
-        return 255
+    """ Clamp to 0-255 with sign-extension masks instead of compares """
+    val = int(val)
+    # negative values: val >> 31 is all ones, so the AND zeroes them
+    val &= ~(val >> 31)
+    # values over 255: (255 - val) >> 31 is all ones, so the OR saturates
+    return (val | ((255 - val) >> 31)) & 255
 
 
 def add8(a, b):
@@ -72,10 +79,15 @@ def mult8(a, b):
     return uint8(a * b)
 
 
+_sin8_lut = None
+
+
 def sin8(v):
-    """ Sin in 255 "degrees" """
-    vr = v / 127.5 * math.pi
-    return math.sin(vr)
+    """ Sin in 255 "degrees", quantized to a 256-entry table """
+    global _sin8_lut
+    if _sin8_lut is None:
+        _sin8_lut = bytes(128 + int(round(math.sin(i / 127.5 * math.pi) * 127)) for i in range(256))
+    return (_sin8_lut[int(v) & 255] - 128) / 127
 
 
 def cos8(v):
@@ -84,9 +96,20 @@ def cos8(v):
     return math.cos(vr)
 
 
+_wheel_luts = {}
+
+
+@micropython.native
 def color_wheel(hue, val=255):
     """ 255 degree color wheel. HSV but all at full saturation. """
     hue = uint8(hue) % 255
+    # a brightness we already tabulated is three lookups instead of the math;
+    # tables are only ever created through color_wheel_lut so transient
+    # brightness values don't grow the cache
+    lut = _wheel_luts.get(val)
+    if lut is not None:
+        i = hue * 3
+        return lut[i], lut[i + 1], lut[i + 2]
     pa = hue % 85
     ss = val / 85
     ci = uint8(ss * pa)
@@ -99,6 +122,17 @@ def color_wheel(hue, val=255):
         return ci, 0, cd
 
 
+def color_wheel_lut(val=255):
+    """ Memoized color_wheel as a flat 765 byte table, one entry per hue at the given brightness.
+        Lets generators trade the per-color wheel math for a slice lookup.
+    """
+    lut = _wheel_luts.get(val)
+    if lut is None:
+        lut = bytes(c for hue in range(255) for c in color_wheel(hue, val))
+        _wheel_luts[val] = lut
+    return lut
+
+
 def heat_color(temp):
     """ Return loose approximation of black body radiation. """
     # normalizing to 191 and using last 6 bits of that for heat_ramp was borrowed from FastLED
@@ -112,32 +146,43 @@ def heat_color(temp):
         return 255, 255, heat_ramp
 
 
-def rand32(pct):
-    """ Return a random 32 bit int with approximate percentage of ones."""
+# cut-off percentages and the and/or fold that hits each ones-density bucket
+# saturating brighten tables keyed by shift amount, built on first use
+_shift_luts = {}
+
+_RAND32_CUTS = (6, 19, 31, 44, 56, 69, 81, 94, 100)
+_RAND32_OPS = ('&&&', '&&', '&', '|&', '', '&|', '|', '||', '|||')
+
+
+def _rand32_ops(pct):
+    """ Pick the and/or fold that hits the ones-density bucket for pct """
+    i = 0
+    for cut in _RAND32_CUTS:
+        if pct <= cut:
+            break
+        i += 1
+    return _RAND32_OPS[i]
+
+
+def _rand32_fold(ops):
     # grb = random.getrandbits() ~ 50% 1's
     grb = getrandbits
+    val = grb(32)
+    for op in ops:
+        if op == '&':
+            val &= grb(32)
+        else:
+            val |= grb(32)
+    return val
+
+
+def rand32(pct):
+    """ Return a random 32 bit int with approximate percentage of ones."""
     if pct < 1:
         return 0
-    elif pct <= 6:
-        return grb(32) & grb(32) & grb(32) & grb(32)
-    elif pct <= 19:
-        return grb(32) & grb(32) & grb(32)
-    elif pct <= 31:
-        return grb(32) & grb(32)
-    elif pct <= 44:
-        return grb(32) & (grb(32) | grb(32))
-    elif pct <= 56:
-        return grb(32)
-    elif pct <= 69:
-        return grb(32) | (grb(32) & grb(32))
-    elif pct <= 81:
-        return grb(32) | grb(32)
-    elif pct <= 94:
-        return grb(32) | grb(32) | grb(32)
-    elif pct >= 100:
+    if pct >= 100:
         return 2 ** 32 - 1
-    else:
-        return grb(32) | grb(32) | grb(32) | grb(32)
+    return _rand32_fold(_rand32_ops(pct))
 
 
 def randrange(low, high):
@@ -158,10 +203,13 @@ def randrange(low, high):
 
 def colval(val, bpp=3):
     """ allow the input of color values as ints (including hex) and None/0 for black """
+    # tuples are what the setters hand us on the hot path, return them untouched
+    if type(val) is tuple and val:
+        return val
     if not val:
-        val = (0,) * bpp
-    elif isinstance(val, int):
-        val = tuple(val.to_bytes(bpp, 'big'))
+        return (0,) * bpp
+    if isinstance(val, int):
+        return tuple(val.to_bytes(bpp, 'big'))
     return val
 
 
@@ -196,22 +244,25 @@ class BitMap:
         bit_idx = idx % 8
         mask = 1 << bit_idx
         if val is None:
-            return (self.buf[byte_idx] & mask) >> bit_idx
-        if val == 0:
-            self.buf[byte_idx] &= ~mask
-        elif val == 1:
-            self.buf[byte_idx] |= mask
+            return (self.buf[byte_idx] >> bit_idx) & 1
+        # clear-then-merge handles both values without branching on val
+        self.buf[byte_idx] = (self.buf[byte_idx] & ~mask & 255) | ((val & 1) << bit_idx)
 
     def __getitem__(self, i):
+        # bit() is inlined here since this runs once per pixel per frame
         if 0 <= i < self.n:
-            return self.bit(i)
+            if self._po:
+                i = (i + self._po) % self.n
+            return (self.buf[i >> 3] >> (i & 7)) & 1
         else:
             raise IndexError('index out of range')
 
     def __setitem__(self, i, val):
         if 0 <= i < self._mi:
-            #
-            self.bit(i, val)
+            if self._po:
+                i = (i + self._po) % self.n
+            b = i & 7
+            self.buf[i >> 3] = (self.buf[i >> 3] & ~(1 << b) & 255) | ((val & 1) << b)
         else:
             raise IndexError('index out of range')
 
@@ -223,44 +274,85 @@ class BitMap:
         self._po = 0
         if pct is None:
             pct = self.pct
-        buf = bytearray()
-        for i in range(self.wc):
-            buf += struct.pack('I', rand32(pct))
-        self.buf = buf
+        if pct < 1 or pct >= 100:
+            self.repeat(BITS_NONE if pct < 1 else BITS_ALL)
+        elif 45 <= pct <= 56:
+            # raw PRNG words are already ~50% ones, no need for the rand32 fold
+            for i in range(self.wc):
+                self.buf[i * 4:i * 4 + 4] = getrandbits(32).to_bytes(4, 'little')
+        else:
+            # pick the density fold once instead of re-branching on pct every word
+            ops = _rand32_ops(pct)
+            for i in range(self.wc):
+                self.buf[i * 4:i * 4 + 4] = _rand32_fold(ops).to_bytes(4, 'little')
 
     def repeat(self, val):
         """ fill buffer by repeating val """
         self._po = 0
         if not isinstance(val, int) or val >= 1 << 32:
             raise ValueError('Value error must be int')
-        if val < 256:
-            n = self.wc * 4
-            v = val
-            self.buf = bytearray([v] * n)
+        v = val.to_bytes(max(1, (val.bit_length() + 7) // 8), 'little')
+        nbytes = self.wc * 4
+        reps = (nbytes + len(v) - 1) // len(v)
+        self.buf = bytearray((v * reps)[0:nbytes])
+
+    def set_range(self, start, end, val=1):
+        """ Set bits start through end (inclusive) in bulk, filling whole bytes
+            with slice stores and only masking at the edges """
+        if start > end or not 0 <= start < self.n:
             return
-        elif val < 1 << 16:
-            n = self.wc * 2
-            v = val.to_bytes(2, 'little')
-        elif val < 1 << 24:
-            n = math.ceil(self.wc * 4 / 3)
-            v = val.to_bytes(3, 'little')
+        end = min(end, self.n - 1)
+        if self._po:
+            # a contiguous range maps to at most two contiguous storage ranges
+            s = (start + self._po) % self.n
+            e = s + (end - start)
+            if e < self.n:
+                self._fill_bits(s, e, val)
+            else:
+                self._fill_bits(s, self.n - 1, val)
+                self._fill_bits(0, e - self.n, val)
         else:
-            n = self.wc
-            v = struct.pack('I', val)
-
-        buf = bytearray()
-        for i in range(n):
-            buf += v
-        self.buf = buf[0:self.wc * 4]
+            self._fill_bits(start, end, val)
+
+    def _fill_bits(self, lo, hi, val):
+        buf = self.buf
+        lb = lo >> 3
+        rb = hi >> 3
+        lmask = (255 << (lo & 7)) & 255
+        rmask = 255 >> (7 - (hi & 7))
+        if lb == rb:
+            mask = lmask & rmask
+            if val:
+                buf[lb] |= mask
+            else:
+                buf[lb] &= ~mask & 255
+            return
+        if val:
+            buf[lb] |= lmask
+            buf[rb] |= rmask
+            buf[lb + 1:rb] = b'\xff' * (rb - lb - 1)
+        else:
+            buf[lb] &= ~lmask & 255
+            buf[rb] &= ~rmask & 255
+            buf[lb + 1:rb] = bytes(rb - lb - 1)
+
+    def popcount(self):
+        """ Count the 1 bits in one C-level pass instead of n single-bit reads """
+        val = int.from_bytes(self.buf, 'little')
+        if self.n < self._mi:
+            # repeat() fills whole words, ignore the bits past n
+            val &= (1 << self.n) - 1
+        return bin(val).count('1')
 
     def print(self):
         p = '{:4d} | {:08b} {:08b} {:08b} {:08b} | {:4d}'
-        print('     | ' + '76543210 ' * 4 + '|     ')
-        print('-' * 49)
+        # build all the rows first so the output goes out in one write
+        rows = ['     | ' + '76543210 ' * 4 + '|     ', '-' * 49]
         for i in range(0, self.wc * 4, 4):
             bts = list(reversed(self.buf[i:i+4]))
-            vals =[i * 8 + 31] + bts + [i * 8]
-            print(p.format(*vals))
+            vals = [i * 8 + 31] + bts + [i * 8]
+            rows.append(p.format(*vals))
+        print('\n'.join(rows))
 
 
 class ByteMap:
@@ -277,6 +369,8 @@ class ByteMap:
         self.bpi = bpi
         self.buf = bytearray(n * bpi)
         self.order = order
+        # reusable rotate buffer for scroll(), allocated on first use
+        self._scratch = None
 
     def __setitem__(self, key, value):
         value = bytes(colval(value, self.bpi))
@@ -327,58 +421,102 @@ class ByteMap:
         self.n = len(self.buf) // self.bpi
 
     def add(self, val):
+        buf = self.buf
         if isinstance(val, (list, tuple)):
             if len(val) < self.bpi:
                 raise ValueError('Length of value to add must match byte size.')
-            self.buf = bytearray([uint8(self.buf[i] + val[i % self.bpi]) for i in range(self.n * self.bpi)])
+            bpi = self.bpi
+            for i in range(self.n * bpi):
+                buf[i] = uint8(buf[i] + val[i % bpi])
         else:
-            self.buf = bytearray([uint8(v + val) for v in self.buf])
+            for i in range(len(buf)):
+                buf[i] = uint8(buf[i] + val)
 
     def sub(self, val):
+        buf = self.buf
         if isinstance(val, (list, tuple)):
             if len(val) < self.bpi:
                 raise ValueError('Length of value to sub must match byte size.')
-            self.buf = bytearray([uint8(self.buf[i] - val[i % self.bpi]) for i in range(self.n * self.bpi)])
+            bpi = self.bpi
+            for i in range(self.n * bpi):
+                buf[i] = uint8(buf[i] - val[i % bpi])
         else:
-            self.buf = bytearray([uint8(v - val) for v in self.buf])
+            for i in range(len(buf)):
+                buf[i] = uint8(buf[i] - val)
 
     def mul(self, val):
+        buf = self.buf
         if isinstance(val, (list, tuple)):
             if len(val) < self.bpi:
                 raise ValueError('Length of value to multiply must match byte size.')
-            self.buf = bytearray([uint8(self.buf[i] * val[i % self.bpi]) for i in range(self.n * self.bpi)])
+            bpi = self.bpi
+            for i in range(self.n * bpi):
+                buf[i] = uint8(buf[i] * val[i % bpi])
         else:
-            self.buf = bytearray([uint8(v * val) for v in self.buf])
+            for i in range(len(buf)):
+                buf[i] = uint8(buf[i] * val)
 
     def div(self, val):
+        buf = self.buf
         if isinstance(val, (list, tuple)):
             if len(val) < self.bpi:
                 raise ValueError('Length of value to divide must match byte size.')
-            self.buf = bytearray([uint8(self.buf[i] // val[i % self.bpi]) for i in range(self.n * self.bpi)])
+            bpi = self.bpi
+            for i in range(self.n * bpi):
+                buf[i] = uint8(buf[i] // val[i % bpi])
         else:
-            self.buf = bytearray([uint8(v // val) for v in self.buf])
+            for i in range(len(buf)):
+                buf[i] = uint8(buf[i] // val)
 
     def scroll(self, step=1):
-        cut = self.bpi * -step
-        self.buf = self.buf[cut:] + self.buf[:cut]
+        buf = self.buf
+        nb = len(buf)
+        if nb == 0:
+            return
+        cut = self.bpi * -step % nb
+        scratch = self._scratch
+        if scratch is None or len(scratch) != nb:
+            scratch = bytearray(nb)
+        # two C-level copies into the reusable scratch, then swap the buffers
+        # so repeated scrolls allocate nothing
+        mv = memoryview(buf)
+        scratch[0:nb - cut] = mv[cut:]
+        scratch[nb - cut:] = mv[:cut]
+        self.buf = scratch
+        self._scratch = buf
 
     def fill(self, val, start_pos=0, end_pos=None):
-        val = colval(val, self.bpi)
+        val = bytes(colval(val, self.bpi))
         if end_pos is None or end_pos >= self.n:
             end_pos = self.n - 1
-        for i in range(start_pos, end_pos + 1):
-            self[i] = val
+        # repeat the item bytes and store them with one slice assignment
+        count = end_pos - start_pos + 1
+        off = start_pos * self.bpi
+        self.buf[off:off + count * self.bpi] = val * count
 
     def fill_gradient(self, v1, v2, start_pos=0, end_pos=None):
         if end_pos is None or end_pos >= self.n:
             end_pos = self.n - 1
         steps = end_pos - start_pos
-        v1 = colval(v1, self.bpi)
-        v2 = colval(v2, self.bpi)
-        inc = step_inc(v1, v2, steps)
+        bpi = self.bpi
+        v1 = colval(v1, bpi)
+        v2 = colval(v2, bpi)
+        # same 16.16 fixed-point walk as TrickLED.fill_gradient, written
+        # straight into the buffer instead of building a tuple per item;
+        # slopes truncate toward zero so the accumulators never run past
+        # the endpoints and wrap in the unclamped byte store
+        buf = self.buf
+        acc = [v1[j] << 16 for j in range(bpi)]
+        inc = []
+        for j in range(bpi):
+            d = (v2[j] - v1[j]) << 16
+            inc.append(d // steps if d >= 0 else -(-d // steps))
+        off = start_pos * bpi
         for i in range(steps):
-            val = tuple(uint8(v1[n] + inc[n] * i) for n in range(self.bpi))
-            self[start_pos + i] = val
+            for j in range(bpi):
+                buf[off] = acc[j] >> 16 & 255
+                acc[j] += inc[j]
+                off += 1
         self[end_pos] = v2
 
     def fill_gen(self, gen, start_pos=0, end_pos=None, direction=1):
@@ -414,8 +552,21 @@ class TrickLED(NeoPixel):
 
     def __setitem__(self, i, val):
         if 0 <= i < self.n:
-            val = colval(val, self.bpp)
-            super().__setitem__(i, val)
+            t = type(val)
+            if t is int:
+                # hex colors skip colval and the parent's per-channel unpack;
+                # the bytes land in the buffer already in strip order
+                bpp = self.bpp
+                col = val.to_bytes(bpp, 'big')
+                order = self.ORDER
+                buf = self.buf
+                off = i * bpp
+                for j in range(bpp):
+                    buf[off + order[j]] = col[j]
+            elif t is tuple or t is bytes:
+                super().__setitem__(i, val)
+            else:
+                super().__setitem__(i, colval(val, self.bpp))
         else:
             raise IndexError('Assignment index out of range')
 
@@ -428,8 +579,19 @@ class TrickLED(NeoPixel):
 
         :param step: Number and direction to shift pixels
         """
-        cut = self.bpp * -step
-        self.buf = self.buf[cut:] + self.buf[:cut]
+        if step == 0:
+            return
+        buf = self.buf
+        k = self.bpp * abs(step)
+        # rotate in place: stash the wrapped edge, shift the bulk, write the edge back
+        if step > 0:
+            tmp = bytes(buf[-k:])
+            buf[k:] = buf[:-k]
+            buf[:k] = tmp
+        else:
+            tmp = bytes(buf[:k])
+            buf[:-k] = buf[k:]
+            buf[-k:] = tmp
 
     def fill_solid(self, color, start_pos=0, end_pos=None):
         """
@@ -441,8 +603,9 @@ class TrickLED(NeoPixel):
         """
         if end_pos is None or end_pos >= self.n:
             end_pos = (self.repeat_n or self.n) - 1
-        for i in range(start_pos, end_pos + 1):
-            self[i] = color
+        # splat the ordered color bytes over the range in one slice write
+        col = bytes(self._rgb_to_order(colval(color, self.bpp)))
+        self.buf[start_pos * self.bpp:(end_pos + 1) * self.bpp] = col * (end_pos - start_pos + 1)
 
     def fill_gradient(self, col1, col2, start_pos=0, end_pos=None):
         """
@@ -458,10 +621,25 @@ class TrickLED(NeoPixel):
         steps = end_pos - start_pos
         col1 = colval(col1, self.bpp)
         col2 = colval(col2, self.bpp)
-        inc = step_inc(col1, col2, steps)
+        # write channel bytes straight into the buffer, skipping per-pixel tuple + __setitem__.
+        # slopes are 16.16 fixed point so each step is an integer add instead
+        # of a float multiply and clamp; slopes truncate toward zero so the
+        # accumulators stay between the two endpoint values and the shifted
+        # byte never needs clamping (floor division would let a falling
+        # channel drift below zero and wrap)
+        buf = self.buf
+        bpp = self.bpp
+        order = self.ORDER
+        acc = [col1[j] << 16 for j in range(bpp)]
+        inc = []
+        for j in range(bpp):
+            d = (col2[j] - col1[j]) << 16
+            inc.append(d // steps if d >= 0 else -(-d // steps))
         for i in range(steps):
-            col = tuple(uint8(col1[n] + inc[n] * i) for n in range(len(col1)))
-            self[start_pos + i] = col
+            off = (start_pos + i) * bpp
+            for j in range(bpp):
+                buf[off + order[j]] = acc[j] >> 16 & 255
+                acc[j] += inc[j]
         self[end_pos] = col2
 
     def fill_gen(self, gen, start_pos=0, end_pos=None, direction=1):
@@ -474,12 +652,51 @@ class TrickLED(NeoPixel):
         """
         if end_pos is None or end_pos >= self.n:
             end_pos = (self.repeat_n or self.n) - 1
+        # the range is already bounded so skip our own per-pixel bounds check,
+        # but keep the colval conversion for generators that yield ints
+        setitem = super().__setitem__
+        bpp = self.bpp
         if direction > 0:
-            for i in range(start_pos, end_pos + 1):
-                self[i] = next(gen)
+            rng = range(start_pos, end_pos + 1)
         else:
-            for i in range(end_pos, start_pos - 1, -1):
-                self[i] = next(gen)
+            rng = range(end_pos, start_pos - 1, -1)
+        for i in rng:
+            val = next(gen)
+            t = type(val)
+            if t is tuple or t is bytes:
+                setitem(i, val)
+            else:
+                setitem(i, colval(val, bpp))
+
+    def fill_random(self, mask=None, start_pos=0, end_pos=None):
+        """
+        Fill strip with random colors.
+
+        :param mask: Bit mask per channel to control hue. (255, 0, 63) would give red to purple colors.
+        :param start_pos: Start position, defaults to beginning of strip
+        :param end_pos: End position, defaults to end of strip
+        """
+        if end_pos is None or end_pos >= self.n:
+            end_pos = (self.repeat_n or self.n) - 1
+        bpp = self.bpp
+        nbytes = (end_pos - start_pos + 1) * bpp
+        # draw 4 bytes of randomness at a time (the esp ports cap getrandbits at 32)
+        raw = bytearray(((nbytes + 3) // 4) * 4)
+        for i in range(0, len(raw), 4):
+            raw[i:i + 4] = getrandbits(32).to_bytes(4, 'little')
+        if mask:
+            if len(mask) != bpp:
+                raise ValueError('Mask must contain one value per channel')
+            # AND the whole region as one big int against a tiled mask; the
+            # tile is cached since animations respark with the same mask
+            key = (bytes(mask), len(raw))
+            cached = getattr(self, '_mask_tile', None)
+            if cached is None or cached[0] != key:
+                tile = bytes(self._rgb_to_order(mask)) * (len(raw) // bpp + 1)
+                self._mask_tile = (key, int.from_bytes(tile[0:len(raw)], 'big'))
+            val = int.from_bytes(raw, 'big') & self._mask_tile[1]
+            raw = val.to_bytes(len(raw), 'big')
+        self.buf[start_pos * bpp:(end_pos + 1) * bpp] = raw[0:nbytes]
 
     def blend_to_color(self, color=0, pct=50, start_pos=0, end_pos=None):
         """
@@ -491,67 +708,112 @@ class TrickLED(NeoPixel):
         :param end_pos: End position
         """
         color = colval(color, self.bpp)
-        last_col = (0,) * self.bpp
-        blend_col = (0,) * self.bpp
+        if not 0 <= pct <= 100:
+            return
         if end_pos is None:
             end_pos = (self.repeat_n or self.n) - 1
-        for i in range(start_pos, end_pos + 1):
-            if self[i] == blend_col:
-                continue
-            elif self[i] == last_col:
-                self[i] = blend_col
-            else:
-                last_col = self[i]
-                blend_col = blend(self[i], color, pct)
-                self[i] = blend_col
+        # blend through per-channel tables so each byte is one lookup; the
+        # tables are cached since fades reuse the same color and pct each frame
+        target = self._rgb_to_order(color)
+        key = (bytes(target), pct)
+        if getattr(self, '_blend_key', None) != key:
+            self._blend_luts = [bytes(v + (t - v) * pct // 100 for v in range(256)) for t in target]
+            self._blend_key = key
+        buf = self.buf
+        bpp = self.bpp
+        for j in range(bpp):
+            lut = self._blend_luts[j]
+            for i in range(start_pos * bpp + j, (end_pos + 1) * bpp, bpp):
+                buf[i] = lut[buf[i]]
 
     def add(self, val):
         bpp = self.bpp
-        mi = self.repeat_n or self.n
+        buf = self.buf
+        nb = (self.repeat_n or self.n) * bpp
         if isinstance(val, (list, tuple)):
             if len(val) < bpp:
                 raise ValueError('Length of value to add must match bpp')
             # convert RGB to string byte order
             val = self._rgb_to_order(val)
-            self.buf = bytearray([uint8(self.buf[i] + val[i % bpp]) for i in range(mi * bpp)])
+            for i in range(nb):
+                buf[i] = uint8(buf[i] + val[i % bpp])
         else:
-            self.buf = bytearray([uint8(self.buf[i] + val) for i in range(mi * bpp)])
+            for i in range(nb):
+                buf[i] = uint8(buf[i] + val)
 
     def sub(self, val):
         bpp = self.bpp
-        mi = self.repeat_n or self.n
+        buf = self.buf
+        nb = (self.repeat_n or self.n) * bpp
         if isinstance(val, (list, tuple)):
             if len(val) < bpp:
                 raise ValueError('Length of value to subtract must match bpp')
             # convert RGB to string byte order
             val = self._rgb_to_order(val)
-            self.buf = bytearray([uint8(self.buf[i] - val[i % bpp]) for i in range(mi * bpp)])
+            for i in range(nb):
+                buf[i] = uint8(buf[i] - val[i % bpp])
         else:
-            self.buf = bytearray([uint8(self.buf[i] - val) for i in range(mi * bpp)])
+            for i in range(nb):
+                buf[i] = uint8(buf[i] - val)
 
     def mul(self, val):
         bpp = self.bpp
-        mi = self.repeat_n or self.n
+        buf = self.buf
+        nb = (self.repeat_n or self.n) * bpp
         if isinstance(val, (list, tuple)):
             if len(val) < bpp:
                 raise ValueError('Length of value to multiply must match bpp')
             # convert RGB to string byte order
             val = self._rgb_to_order(val)
-            self.buf = bytearray([uint8(self.buf[i] * val[i % bpp]) for i in range(mi * bpp)])
+            for i in range(nb):
+                buf[i] = uint8(buf[i] * val[i % bpp])
         else:
-            self.buf = bytearray([uint8(self.buf[i] * val) for i in range(mi * bpp)])
+            for i in range(nb):
+                buf[i] = uint8(buf[i] * val)
 
     def div(self, val):
         bpp = self.bpp
-        mi = self.repeat_n or self.n
+        buf = self.buf
+        nb = (self.repeat_n or self.n) * bpp
         if isinstance(val, (list, tuple)):
             if len(val) < bpp:
-                raise ValueError('Length of value to multiply must match bpp')
+                raise ValueError('Length of value to divide must match bpp')
             # convert RGB to string byte order
             val = self._rgb_to_order(val)
-            self.buf = bytearray([uint8(self.buf[i] / val[i % bpp]) for i in range(mi * bpp)])
+            for i in range(nb):
+                buf[i] = uint8(buf[i] / val[i % bpp])
         else:
-            self.buf = bytearray([uint8(self.buf[i] / val) for i in range(mi * bpp)])
+            for i in range(nb):
+                buf[i] = uint8(buf[i] / val)
+
+    def dim(self, shift=1):
+        """
+        Divide all channels by 2**shift. The whole buffer is processed as one
+        big int so the shift and lane mask happen in two C-level operations.
+
+        :param shift: Number of bits to shift each channel right
+        """
+        if shift < 1:
+            return
+        nb = (self.repeat_n or self.n) * self.bpp
+        mask = int.from_bytes(bytes([255 >> shift]) * nb, 'big')
+        val = (int.from_bytes(self.buf[0:nb], 'big') >> shift) & mask
+        self.buf[0:nb] = val.to_bytes(nb, 'big')
+
+    def brighten(self, shift=1):
+        """
+        Multiply all channels by 2**shift, saturating at 255.
+
+        :param shift: Number of bits to shift each channel left
+        """
+        if shift < 1:
+            return
+        lut = _shift_luts.get(shift)
+        if lut is None:
+            lut = _shift_luts[shift] = bytes(uint8(v << shift) for v in range(256))
+        buf = self.buf
+        for i in range((self.repeat_n or self.n) * self.bpp):
+            buf[i] = lut[buf[i]]
 
     def _repeat_stripe(self, n=None):
         """
@@ -561,30 +823,45 @@ class TrickLED(NeoPixel):
         """
         if n is None:
             n = self.repeat_n
-        loc = jump = n * self.bpp
+        loc = n * self.bpp
         end = self.n * self.bpp
-        section = self.buf[0:jump]
-        while loc + jump <= end:
-            self.buf[loc:loc + jump] = section
-            loc += jump
+        buf = self.buf
+        # double the filled prefix each pass so a strip takes log2 copies
+        # instead of one per repetition, with no section snapshot
+        while loc * 2 <= end:
+            buf[loc:loc * 2] = buf[0:loc]
+            loc *= 2
         if loc < end:
-            self.buf[loc:end] = section[:(end - loc)]
+            buf[loc:end] = buf[0:end - loc]
 
     def _repeat_mirror(self, n=None):
         """ Copy the first n pixels and repeat them alternating directions """
         if n is None:
             n = self.repeat_n
-        rl = n - 1
-        d = -1
-        setitem = super().__setitem__
-        for i in range(n, self.n):
-            setitem(i, self[rl])
-            if 0 < rl < n:
-                rl += 1 * d
-            elif rl == 0:
-                d = 1
-            else:
-                d = -1
+        # the target -> source mapping only depends on n, so walk the
+        # direction state machine once and blit along the cached index
+        # list on every write after that
+        cached = getattr(self, '_mirror_idx', None)
+        if cached is None or cached[0] != n:
+            idx = []
+            rl = n - 1
+            d = -1
+            for i in range(n, self.n):
+                idx.append(rl)
+                if 0 < rl < n:
+                    rl += 1 * d
+                elif rl == 0:
+                    d = 1
+                else:
+                    d = -1
+            cached = self._mirror_idx = (n, idx)
+        buf = self.buf
+        bpp = self.bpp
+        off = n * bpp
+        for src in cached[1]:
+            so = src * bpp
+            buf[off:off + bpp] = buf[so:so + bpp]
+            off += bpp
 
     def write(self):
         if self.repeat_n:
@@ -608,16 +885,19 @@ class TrickMatrix(NeoPixel):
             self.shape = shape
         self.width = width
         self.height = height
-        super().__init__(pin, width * height, **kwargs)    
-    
+        # per-row index bases, with reversed rows carrying the offset of
+        # their last pixel and a negative direction flag
+        self._row_base = [width * y for y in range(height)]
+        self._row_rev = [bool(y % 2) and self.shape == self.LAYOUT_SNAKE for y in range(height)]
+        super().__init__(pin, width * height, **kwargs)
+
     def _idx(self, x, y):
         """ Return the index of the x, y coordinate """
         if x >= self.width or y >= self.height:
             raise IndexError('Out of bounds error. Dimensions are %d x %d' % (self.width, self.height))
-        if y % 2 == 0 or self.shape == self.LAYOUT_STRAIGHT:
-            return self.width * y + x
-        else:
-            return self.width * (y + 1) - x - 1          
+        if self._row_rev[y]:
+            return self._row_base[y] + self.width - x - 1
+        return self._row_base[y] + x
         
     def pixel(self, x, y, color=None):
         """
@@ -630,24 +910,95 @@ class TrickMatrix(NeoPixel):
             if isinstance(color, int):
                 color = color.to_bytes(self.bpp, 'big')
             self[idx] = color
-            
+
     def hline(self, x, y, width, color):
-        for ix in range(x, x + width):
-            self.pixel(ix, y, color)
-    
+        if width < 1:
+            return
+        if isinstance(color, int):
+            color = color.to_bytes(self.bpp, 'big')
+        # resolve the row ends once; the run is contiguous in the buffer
+        # whichever way the row is stored, so splat it with one slice write
+        base = self._idx(x, y)
+        last = self._idx(x + width - 1, y)
+        lo = base if base <= last else last
+        bpp = self.bpp
+        ordered = bytearray(bpp)
+        for i in range(bpp):
+            ordered[self.ORDER[i]] = color[i]
+        off = lo * bpp
+        self.buf[off:off + width * bpp] = bytes(ordered) * width
+
     def vline(self, x, y, height, color):
-        for iy in range(y, y + height):
-            self.pixel(x, iy, color)
-    
+        if height < 1:
+            return
+        if isinstance(color, int):
+            color = color.to_bytes(self.bpp, 'big')
+        base = self._idx(x, y)
+        self._idx(x, y + height - 1)
+        if self.shape == self.LAYOUT_STRAIGHT:
+            w = self.width
+            for i in range(height):
+                self[base + i * w] = color
+        else:
+            # snake rows alternate direction, so the column steps down by two
+            # alternating amounts instead of a constant width
+            d_even = 2 * self.width - 2 * x - 1
+            d_odd = 2 * x + 1
+            idx = base
+            iy = y
+            for i in range(height):
+                self[idx] = color
+                idx += d_even if iy % 2 == 0 else d_odd
+                iy += 1
+
     def fill_rect(self, x, y, width, height, color):
+        if isinstance(color, int):
+            color = color.to_bytes(self.bpp, 'big')
         for iy in range(y, y + height):
-            for ix in range(x, x + width):
-                self.pixel(ix, iy, color)
+            self.hline(x, iy, width, color)
     
     def hscroll(self, step):
-        """ TODO: implement matrix scrolling """
-        pass
+        """ Scroll pixels horizontally, wrapping around the edges.
+
+        :param step: Number and direction of columns to shift
+        """
+        if step == 0:
+            return
+        w = self.width * self.bpp
+        cut = self.bpp * -step
+        buf = self.buf
+        for y in range(self.height):
+            if y % 2 and self.shape == self.LAYOUT_SNAKE:
+                # odd snake rows are stored reversed so they rotate the other way
+                c = -cut
+            else:
+                c = cut
+            o = y * w
+            row = buf[o:o + w]
+            buf[o:o + w] = row[c:] + row[:c]
 
     def vscroll(self, step):
-        """ TODO: implement matrix scrolling """
-        pass
+        """ Scroll pixels vertically, wrapping around the top and bottom.
+
+        :param step: Number and direction of rows to shift
+        """
+        step %= self.height
+        if step == 0:
+            return
+        w = self.width * self.bpp
+        cut = w * -step
+        self.buf = self.buf[cut:] + self.buf[:cut]
+        if self.shape == self.LAYOUT_SNAKE:
+            # rows that wrapped around moved a different distance than the
+            # others, so decide per row whether its content changed storage
+            # direction and flip only those back
+            buf = self.buf
+            bpp = self.bpp
+            h = self.height
+            for y in range(h):
+                if (y - (y - step) % h) % 2 == 0:
+                    continue
+                o = y * w
+                row = buf[o:o + w]
+                for x in range(self.width):
+                    buf[o + x * bpp:o + (x + 1) * bpp] = row[w - (x + 1) * bpp:w - x * bpp]